@@ -103,6 +103,7 @@ export const eslintConfig = [
     files: [
       "src/cli.ts",
       "src/config.ts",
+      "src/doctor.ts",
       "src/state.ts",
       "src/application/commands/handlers/**/*.{ts,tsx}",
       "src/infrastructure/storage/**/*.{ts,tsx}",
@@ -0,0 +1,120 @@
+import type { Command } from "commander";
+import { describe, expect, it } from "vitest";
+
+import {
+  createProgram,
+  findRequestedCommand,
+} from "../application/commands/command.program.js";
+
+const ALL_COMMANDS = [
+  "init",
+  "doctor",
+  "provision",
+  "snapshot",
+  "destroy",
+  "secrets",
+];
+
+function commandNames(program: Command): string[] {
+  return program.commands.map((command) => command.name());
+}
+
+function hasPreserveLogsOption(program: Command): boolean {
+  const destroy = program.commands.find(
+    (command) => command.name() === "destroy",
+  );
+  return (
+    destroy?.options.some((option) => option.long === "--preserve-logs") ??
+    false
+  );
+}
+
+describe("cli", () => {
+  describe("findRequestedCommand", () => {
+    it("should skip global options and their values", () => {
+      expect(
+        findRequestedCommand([
+          "node",
+          "envkit",
+          "-p",
+          "x.yaml",
+          "destroy",
+          "--preserve-logs",
+        ]),
+      ).toBe("destroy");
+      expect(
+        findRequestedCommand(["node", "envkit", "--path=x.yaml", "doctor"]),
+      ).toBe("doctor");
+    });
+
+    it("should return the help command name", () => {
+      expect(findRequestedCommand(["node", "envkit", "help", "doctor"])).toBe(
+        "help",
+      );
+    });
+
+    it("should return undefined when only options are given", () => {
+      expect(findRequestedCommand(["node", "envkit", "--help"])).toBe(
+        undefined,
+      );
+      expect(findRequestedCommand(["node", "envkit", "-p", "x.yaml"])).toBe(
+        undefined,
+      );
+    });
+  });
+
+  describe("createProgram", () => {
+    it("should build only the requested command and list the rest", async () => {
+      const program = await createProgram([
+        "node",
+        "envkit",
+        "-p",
+        "x.yaml",
+        "doctor",
+      ]);
+
+      expect(commandNames(program)).toEqual(ALL_COMMANDS);
+      // destroy is only a placeholder, so it has no options registered
+      expect(hasPreserveLogsOption(program)).toBe(false);
+    });
+
+    it("should build the destroy command with its options", async () => {
+      const program = await createProgram([
+        "node",
+        "envkit",
+        "-p",
+        "x.yaml",
+        "destroy",
+        "--preserve-logs",
+      ]);
+
+      expect(hasPreserveLogsOption(program)).toBe(true);
+    });
+
+    it.each([
+      [["--help"]],
+      [["help", "doctor"]],
+      [["unknown-command"]],
+      [["toString"]],
+      [["__proto__"]],
+      [["constructor"]],
+    ])("should build all commands for %j", async (args) => {
+      const program = await createProgram(["node", "envkit", ...args]);
+
+      expect(commandNames(program)).toEqual(ALL_COMMANDS);
+      expect(hasPreserveLogsOption(program)).toBe(true);
+    });
+
+    it("should take descriptions from the command catalogue", async () => {
+      const program = await createProgram(["node", "envkit", "doctor"]);
+      const descriptions = program.commands.map((command) =>
+        command.description(),
+      );
+      const builtAll = await createProgram(["node", "envkit", "--help"]);
+
+      expect(descriptions).toEqual(
+        builtAll.commands.map((command) => command.description()),
+      );
+    });
+  });
+});
@@ -0,0 +1,48 @@
+import { describe, expect, it } from "vitest";
+
+import { tokenizeCommand } from "../shared/helpers/command-tokenizer.js";
+
+describe("command-tokenizer", () => {
+  describe("tokenizeCommand", () => {
+    it("should split plain words", () => {
+      expect(tokenizeCommand("node --version")).toEqual(["node", "--version"]);
+      expect(tokenizeCommand("  git\tstatus  ")).toEqual(["git", "status"]);
+    });
+
+    it("should keep quoted strings as single arguments", () => {
+      expect(tokenizeCommand("echo 'hello   world'")).toEqual([
+        "echo",
+        "hello   world",
+      ]);
+      expect(tokenizeCommand('echo "a b" c\'d e\'')).toEqual([
+        "echo",
+        "a b",
+        "cd e",
+      ]);
+      expect(tokenizeCommand('echo ""')).toEqual(["echo", ""]);
+    });
+
+    it.each([
+      "echo a | grep a",
+      "node --version && npm --version",
+      "echo hi > out.txt",
+      "echo $HOME",
+      'echo "$HOME"',
+      "ls *.ts",
+      "echo `date`",
+      "echo ~",
+      "cd dir; ls",
+    ])("should fall back to the shell for %s", (command) => {
+      expect(tokenizeCommand(command)).toBeUndefined();
+    });
+
+    it("should fall back to the shell for environment assignments", () => {
+      expect(tokenizeCommand("FOO=1 cmd")).toBeUndefined();
+    });
+
+    it("should fall back to the shell for unterminated quotes and empty input", () => {
+      expect(tokenizeCommand("echo 'open")).toBeUndefined();
+      expect(tokenizeCommand("   ")).toBeUndefined();
+    });
+  });
+});
@@ -1,10 +1,11 @@
+import { createHash } from "node:crypto";
 import { promises as fs } from "node:fs";
 import path from "node:path";
 
 import { NotFoundError, ValidationError } from "@kitiumai/error";
 import { afterEach, beforeEach, describe, expect, it } from "vitest";
 
-import { fingerprintSpec, loadSpec } from "../config.js";
+import { fingerprintSpec, loadSpec, SpecFingerprint } from "../config.js";
 import type { EnvironmentSpec } from "../types.js";
 
 describe("config", () => {
@@ -53,6 +54,28 @@ checks:
       expect(loaded.toolchains).toHaveLength(1);
     });
 
+    it("should load JSON content from a YAML spec", async () => {
+      const specPath = path.join(testDirectory, "generated.yaml");
+      await fs.writeFile(
+        specPath,
+        '{"name": "generated-env", "checks": ["node --version"]}',
+        "utf-8",
+      );
+
+      const spec = await loadSpec(specPath);
+      expect(spec.name).toBe("generated-env");
+      expect(spec.checks).toEqual(["node --version"]);
+    });
+
+    it("should reject duplicate JSON keys in a YAML spec", async () => {
+      const specPath = path.join(testDirectory, "duplicate.yaml");
+      await fs.writeFile(specPath, '{"name": "a", "name": "b"}', "utf-8");
+
+      await expect(loadSpec(specPath)).rejects.toMatchObject({
+        code: "envkit/spec_parse_error",
+      });
+    });
+
     it("should handle relative paths", async () => {
       const specPath = path.join(testDirectory, "test.yaml");
       const content = "name: relative-test";
@@ -96,6 +119,34 @@ checks:
       await expect(loadSpec(specPath)).rejects.toThrow(/requires a valid name/);
     });
 
+    it("should throw ValidationError for toolchain without version", async () => {
+      const specPath = path.join(testDirectory, "bad-toolchain.yaml");
+      const content = `name: test-env
+toolchains:
+  - name: node
+`;
+      await fs.writeFile(specPath, content, "utf-8");
+
+      await expect(loadSpec(specPath)).rejects.toThrow(ValidationError);
+      await expect(loadSpec(specPath)).rejects.toMatchObject({
+        code: "envkit/spec_invalid",
+      });
+    });
+
+    it("should return a frozen spec", async () => {
+      const specPath = path.join(testDirectory, "frozen.yaml");
+      const content = `name: frozen-env
+toolchains:
+  - name: node
+    version: "20"
+`;
+      await fs.writeFile(specPath, content, "utf-8");
+
+      const spec = await loadSpec(specPath);
+      expect(Object.isFrozen(spec)).toBe(true);
+      expect(Object.isFrozen(spec.toolchains?.[0])).toBe(true);
+    });
+
     it("should throw ValidationError for non-object spec", async () => {
       const specPath = path.join(testDirectory, "array.json");
       await fs.writeFile(specPath, "[]", "utf-8");
@@ -143,6 +194,67 @@ checks:
       expect(fp1).toBe(fp2);
     });
 
+    it("should match a fresh fingerprint for loaded specs", async () => {
+      const specPath = path.join(testDirectory, "cached.yaml");
+      await fs.writeFile(specPath, "name: cached-env", "utf-8");
+
+      const spec = await loadSpec(specPath);
+      expect(fingerprintSpec(spec)).toBe(fingerprintSpec({ ...spec }));
+    });
+
+    it("should generate different fingerprints for different toolchain versions", () => {
+      const spec1: EnvironmentSpec = {
+        name: "test",
+        toolchains: [{ name: "node", version: "20" }],
+      };
+      const spec2: EnvironmentSpec = {
+        name: "test",
+        toolchains: [{ name: "node", version: "22" }],
+      };
+
+      expect(fingerprintSpec(spec1)).not.toBe(fingerprintSpec(spec2));
+    });
+
+    it("should update incrementally to match a fresh fingerprint", () => {
+      const fingerprint = new SpecFingerprint({
+        name: "test",
+        toolchains: [{ name: "node", version: "20" }],
+      });
+      fingerprint.set("toolchains", [{ name: "node", version: "22" }]);
+      fingerprint.set("description", "desc");
+
+      expect(fingerprint.digest()).toBe(
+        fingerprintSpec({
+          name: "test",
+          description: "desc",
+          toolchains: [{ name: "node", version: "22" }],
+        }),
+      );
+    });
+
+    it("should hash a field as its key-sorted compact JSON form", () => {
+      const toolchains = [{ version: "20", name: "node", cacheKey: "k" }];
+      const fingerprint = new SpecFingerprint({} as EnvironmentSpec);
+      fingerprint.set("toolchains", toolchains);
+
+      const expected = createHash("sha256")
+        .update('toolchains:[{"cacheKey":"k","name":"node","version":"20"}]')
+        .digest("hex");
+      expect(fingerprint.digest()).toBe(expected);
+    });
+
+    it("should produce a stable golden fingerprint", () => {
+      const spec: EnvironmentSpec = {
+        name: "golden-env",
+        toolchains: [{ version: "20", name: "node" }],
+        checks: ["node --version"],
+      };
+
+      expect(fingerprintSpec(spec)).toBe(
+        "ef399061aee7067b8f56c1e779b4f7a42a24ef75a8825c650a8d33d9032b9327",
+      );
+    });
+
     it("should return a 64-character hex string", () => {
       const spec: EnvironmentSpec = { name: "test" };
       const fp = fingerprintSpec(spec);
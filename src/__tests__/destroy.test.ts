@@ -0,0 +1,69 @@
+import { promises as fs } from "node:fs";
+import path from "node:path";
+
+import { afterEach, beforeEach, describe, expect, it } from "vitest";
+
+import { DestroyCommand } from "../application/commands/handlers/destroy.command.js";
+import { pathExists } from "../state.js";
+
+describe("DestroyCommand", () => {
+  const testDirectory = path.join(process.cwd(), ".test-envkit-destroy");
+  const stateDirectory = path.join(testDirectory, ".envkit");
+  const linkTarget = path.join(testDirectory, "link-target");
+
+  beforeEach(async () => {
+    await fs.mkdir(path.join(stateDirectory, "diagnostics", "nested"), {
+      recursive: true,
+    });
+    await fs.mkdir(linkTarget, { recursive: true });
+    await fs.writeFile(path.join(linkTarget, "keep.txt"), "keep", "utf-8");
+    await fs.writeFile(
+      path.join(stateDirectory, "envkit.lock.json"),
+      "{}",
+      "utf-8",
+    );
+    await fs.writeFile(
+      path.join(stateDirectory, "diagnostics", "nested", "doctor.json"),
+      "{}",
+      "utf-8",
+    );
+    await fs.writeFile(path.join(stateDirectory, "envkit.log"), "log", "utf-8");
+    // Junctions need no extra privileges on Windows; the type is ignored elsewhere
+    await fs.symlink(
+      linkTarget,
+      path.join(stateDirectory, "linked"),
+      "junction",
+    );
+  });
+
+  afterEach(async () => {
+    await fs.rm(testDirectory, { recursive: true, force: true });
+  });
+
+  it("should remove every state entry by default", async () => {
+    const result = await new DestroyCommand().execute({ cwd: testDirectory });
+
+    expect(result.success).toBe(true);
+    expect(await fs.readdir(stateDirectory)).toEqual([]);
+    expect(await pathExists(path.join(linkTarget, "keep.txt"))).toBe(true);
+  });
+
+  it("should keep only envkit.log when preserving logs", async () => {
+    const result = await new DestroyCommand().execute({
+      cwd: testDirectory,
+      preserveLogs: true,
+    });
+
+    expect(result.success).toBe(true);
+    expect(await fs.readdir(stateDirectory)).toEqual(["envkit.log"]);
+    expect(await pathExists(path.join(linkTarget, "keep.txt"))).toBe(true);
+  });
+
+  it("should succeed when there is no state directory", async () => {
+    await fs.rm(stateDirectory, { recursive: true, force: true });
+
+    const result = await new DestroyCommand().execute({ cwd: testDirectory });
+
+    expect(result.success).toBe(true);
+  });
+});
@@ -1,5 +1,6 @@
 import { promises as fs } from "node:fs";
 import path from "node:path";
+import { performance } from "node:perf_hooks";
 
 import { afterEach, beforeEach, describe, expect, it } from "vitest";
 
@@ -50,6 +51,62 @@ describe("doctor", () => {
       expect(report.results[1]?.success).toBe(true);
     });
 
+    it.skipIf(process.platform === "win32")(
+      "should pick up executables after PATH changes",
+      async () => {
+        const originalPath = process.env["PATH"] ?? "";
+        const createProbe = async (directoryName: string, output: string) => {
+          const directory = path.join(testDirectory, directoryName);
+          await fs.mkdir(directory, { recursive: true });
+          const probe = path.join(directory, "envkit-probe");
+          await fs.writeFile(probe, `#!/bin/sh\necho ${output}\n`, "utf-8");
+          await fs.chmod(probe, 0o755);
+          return directory;
+        };
+        const firstDirectory = await createProbe("bin-one", "one");
+        const secondDirectory = await createProbe("bin-two", "two");
+        const spec: EnvironmentSpec = {
+          name: "test-env",
+          checks: ["envkit-probe"],
+        };
+
+        try {
+          process.env["PATH"] = `${firstDirectory}${path.delimiter}${originalPath}`;
+          const first = await runDoctor(spec, { cwd: testDirectory });
+          process.env["PATH"] = `${secondDirectory}${path.delimiter}${originalPath}`;
+          const second = await runDoctor(spec, { cwd: testDirectory });
+
+          expect(first.results[0]?.stdout).toBe("one");
+          expect(second.results[0]?.stdout).toBe("two");
+        } finally {
+          process.env["PATH"] = originalPath;
+        }
+      },
+    );
+
+    it.skipIf(process.platform === "win32")(
+      "should run checks concurrently and keep their order",
+      async () => {
+        const checks = [1, 2, 3, 4].map(
+          (index) => `sleep 0.3 && echo "check-${index}"`,
+        );
+        const spec: EnvironmentSpec = { name: "test-env", checks };
+
+        const startedAt = performance.now();
+        const report = await runDoctor(spec, { cwd: testDirectory });
+        const elapsed = performance.now() - startedAt;
+
+        // Run one after another the four checks would take at least 1200ms
+        expect(elapsed).toBeLessThan(900);
+        expect(report.results.map((result) => result.stdout)).toEqual([
+          "check-1",
+          "check-2",
+          "check-3",
+          "check-4",
+        ]);
+      },
+    );
+
     it("should handle spec with no checks", async () => {
       const spec: EnvironmentSpec = {
         name: "test-env",
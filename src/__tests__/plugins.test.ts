@@ -132,6 +132,23 @@ describe("plugins", () => {
       expect(context["count"]).toBe(2);
     });
 
+    it("should not run hooks registered during the same run", async () => {
+      const calls: string[] = [];
+
+      registry.register(TEST_EVENT, () => {
+        calls.push("outer");
+        registry.register(TEST_EVENT, () => {
+          calls.push("inner");
+        });
+      });
+
+      await registry.run(TEST_EVENT, {});
+      expect(calls).toEqual(["outer"]);
+
+      await registry.run(TEST_EVENT, {});
+      expect(calls).toEqual(["outer", "outer", "inner"]);
+    });
+
     it("should handle async operations in hooks", async () => {
       const results: string[] = [];
 
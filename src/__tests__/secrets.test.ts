@@ -1,9 +1,15 @@
-import { describe, expect, it } from "vitest";
+import { getLogger } from "@kitiumai/logger";
+import { afterEach, describe, expect, it, vi } from "vitest";
 
+import type { SecretsProvider } from "../providers/secrets.js";
 import { SecretsBroker } from "../secrets.js";
 import type { EnvironmentSpec } from "../types.js";
 
 describe("secrets", () => {
+  afterEach(() => {
+    vi.restoreAllMocks();
+  });
+
   describe("SecretsBroker", () => {
     it("should fetch all configured secrets", async () => {
       const spec: EnvironmentSpec = {
@@ -65,6 +71,79 @@ describe("secrets", () => {
       expect(secrets["vault:kv/prod"]).not.toBe(secrets["vault:kv/staging"]);
     });
 
+    it("should log one batched event per outcome", async () => {
+      const logger = getLogger();
+      const infoSpy = vi.spyOn(logger, "info");
+      const warnSpy = vi.spyOn(logger, "warn");
+      const stubProvider: SecretsProvider = {
+        name: "stub",
+        fetchSecret: async (secretPath) => `value-for-${secretPath}`,
+        listSecrets: async () => [],
+      };
+      const spec: EnvironmentSpec = {
+        name: "test-env",
+        secrets: [
+          { provider: "stub", path: "a" },
+          { provider: "stub", path: "b" },
+          { provider: "unknown", path: "c" },
+        ],
+      };
+
+      const broker = new SecretsBroker(spec, {
+        providers: { stub: stubProvider },
+      });
+      await broker.fetchAll();
+
+      expect(infoSpy).toHaveBeenCalledTimes(1);
+      expect(infoSpy).toHaveBeenCalledWith(
+        expect.stringContaining("Secrets fetched successfully"),
+        { count: 2, secrets: ["stub:a", "stub:b"] },
+      );
+      expect(warnSpy).toHaveBeenCalledTimes(1);
+      expect(warnSpy).toHaveBeenCalledWith(
+        expect.stringContaining("Secrets provider not configured"),
+        { count: 1, secrets: ["unknown:c"] },
+      );
+    });
+
+    it("should log earlier outcomes when a later fetch fails", async () => {
+      const logger = getLogger();
+      const infoSpy = vi.spyOn(logger, "info");
+      const warnSpy = vi.spyOn(logger, "warn");
+      const stubProvider: SecretsProvider = {
+        name: "stub",
+        fetchSecret: async (secretPath) => {
+          if (secretPath === "broken") {
+            throw new Error("fetch failed");
+          }
+          return `value-for-${secretPath}`;
+        },
+        listSecrets: async () => [],
+      };
+      const spec: EnvironmentSpec = {
+        name: "test-env",
+        secrets: [
+          { provider: "stub", path: "a" },
+          { provider: "unknown", path: "c" },
+          { provider: "stub", path: "broken" },
+        ],
+      };
+
+      const broker = new SecretsBroker(spec, {
+        providers: { stub: stubProvider },
+      });
+      await expect(broker.fetchAll()).rejects.toThrow("fetch failed");
+
+      expect(infoSpy).toHaveBeenCalledWith(
+        expect.stringContaining("Secrets fetched successfully"),
+        { count: 1, secrets: ["stub:a"] },
+      );
+      expect(warnSpy).toHaveBeenCalledWith(
+        expect.stringContaining("Secrets provider not configured"),
+        { count: 1, secrets: ["unknown:c"] },
+      );
+    });
+
     it("should accept custom cwd option", async () => {
       const spec: EnvironmentSpec = {
         name: "test-env",
@@ -0,0 +1,13 @@
+/**
+ * Descriptions of the built-in CLI commands
+ * Shared by the command handlers and the CLI, which lists commands in help
+ * output without loading their handlers.
+ */
+export const COMMAND_DESCRIPTIONS = {
+  init: "Create a starter envkit.yaml spec and state directories",
+  doctor: "Run environment health checks defined in envkit.yaml",
+  provision: "Provision toolchains and secrets defined in envkit.yaml",
+  snapshot: "Create deterministic lockfile for the current spec",
+  destroy: "Remove envkit state from the current workspace",
+  secrets: "Fetch all secrets via the configured broker",
+} as const;
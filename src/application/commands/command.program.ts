@@ -0,0 +1,226 @@
+import { Command, Option } from "commander";
+
+import { getEnvkitLogger } from "../../logger.js";
+import type { ICommand } from "../../shared/interfaces/command.interface.js";
+import { COMMAND_DESCRIPTIONS } from "./command.catalog.js";
+import { CommandRegistry } from "./command.registry.js";
+
+const DEFAULT_SPEC = "envkit.yaml";
+
+/**
+ * Options accepted before the command name; the same definitions feed
+ * commander and the pre-scan that finds the requested command
+ */
+function createGlobalOptions(): Option[] {
+  return [
+    new Option("-p, --path <path>", "Path to envkit spec").default(
+      DEFAULT_SPEC,
+    ),
+  ];
+}
+
+const GLOBAL_OPTIONS_WITH_VALUE = new Set(
+  createGlobalOptions()
+    .filter((option) => option.required || option.optional)
+    .flatMap((option) => [option.short, option.long])
+    .filter((flag): flag is string => flag !== undefined),
+);
+
+type CommandDefinition = {
+  description: string;
+  create: () => Promise<ICommand>;
+};
+
+/**
+ * Command catalogue
+ * Handlers are imported on demand so commands that never touch the spec
+ * parser, doctor or secrets providers do not pay for loading them.
+ */
+const COMMAND_DEFINITIONS = new Map<string, CommandDefinition>([
+  [
+    "init",
+    {
+      description: COMMAND_DESCRIPTIONS.init,
+      create: async () => {
+        const { InitCommand } = await import(
+          "./handlers/init.command.js"
+        );
+        return new InitCommand();
+      },
+    },
+  ],
+  [
+    "doctor",
+    {
+      description: COMMAND_DESCRIPTIONS.doctor,
+      create: async () => {
+        const { DoctorCommand } = await import(
+          "./handlers/doctor.command.js"
+        );
+        return new DoctorCommand();
+      },
+    },
+  ],
+  [
+    "provision",
+    {
+      description: COMMAND_DESCRIPTIONS.provision,
+      create: async () => {
+        const { ProvisionCommand } = await import(
+          "./handlers/provision.command.js"
+        );
+        return new ProvisionCommand();
+      },
+    },
+  ],
+  [
+    "snapshot",
+    {
+      description: COMMAND_DESCRIPTIONS.snapshot,
+      create: async () => {
+        const { SnapshotCommand } = await import(
+          "./handlers/snapshot.command.js"
+        );
+        return new SnapshotCommand();
+      },
+    },
+  ],
+  [
+    "destroy",
+    {
+      description: COMMAND_DESCRIPTIONS.destroy,
+      create: async () => {
+        const { DestroyCommand } = await import(
+          "./handlers/destroy.command.js"
+        );
+        return new DestroyCommand();
+      },
+    },
+  ],
+  [
+    "secrets",
+    {
+      description: COMMAND_DESCRIPTIONS.secrets,
+      create: async () => {
+        const { SecretsCommand } = await import(
+          "./handlers/secrets.command.js"
+        );
+        return new SecretsCommand();
+      },
+    },
+  ],
+]);
+
+/**
+ * Find the first positional argument (the requested command name),
+ * skipping global options and their values
+ */
+export function findRequestedCommand(argv: string[]): string | undefined {
+  const args = argv.slice(2);
+  for (let index = 0; index < args.length; index++) {
+    const argument = args[index] ?? "";
+    if (GLOBAL_OPTIONS_WITH_VALUE.has(argument)) {
+      index++;
+      continue;
+    }
+    if (!argument.startsWith("-")) {
+      return argument;
+    }
+  }
+  return undefined;
+}
+
+/**
+ * Initialize and register commands
+ * Only the requested command is constructed; help output or an unknown
+ * command name falls back to constructing all of them.
+ */
+async function initializeCommands(
+  requested: string | undefined,
+): Promise<CommandRegistry> {
+  const registry = new CommandRegistry();
+  const requestedDefinition =
+    requested === undefined ? undefined : COMMAND_DEFINITIONS.get(requested);
+  const definitions = requestedDefinition
+    ? [requestedDefinition]
+    : Array.from(COMMAND_DEFINITIONS.values());
+
+  registry.registerMultiple(
+    await Promise.all(definitions.map((definition) => definition.create())),
+  );
+
+  return registry;
+}
+
+/**
+ * Build the commander program for the given argv
+ */
+export async function createProgram(
+  argv: string[] = process.argv,
+): Promise<Command> {
+  const program = new Command();
+  program
+    .name("envkit")
+    .description("Environment toolkit for reproducible, policy-aware setups");
+  for (const option of createGlobalOptions()) {
+    program.addOption(option);
+  }
+
+  const registry = await initializeCommands(findRequestedCommand(argv));
+  const logger = getEnvkitLogger({ component: "cli" });
+
+  // Dynamically register commander commands from registry
+  for (const [name, definition] of COMMAND_DEFINITIONS) {
+    const command = registry.get(name);
+    if (!command) {
+      // Placeholder keeps unbuilt commands listed in help output
+      program.command(name).description(definition.description);
+      continue;
+    }
+
+    const cmd = program.command(command.name).description(command.description);
+
+    // Add command-specific options
+    if (command.name === "destroy") {
+      cmd.option("--preserve-logs", "Keep envkit logs", false);
+    }
+
+    cmd.action(async (commandOptions) => {
+      try {
+        const globalOptions = program.opts();
+        const args = {
+          path: globalOptions["path"],
+          cwd: process.cwd(),
+          ...commandOptions,
+        };
+
+        const result = await registry.execute(command.name, args);
+
+        if (result.success) {
+          if (result.message) {
+            console.info(result.message);
+          }
+          if (result.data) {
+            console.info(JSON.stringify(result.data, null, 2));
+          }
+        } else {
+          console.error(`Error: ${result.message}`);
+          if (result.error) {
+            logger.error("Command execution error", result.error);
+          }
+          process.exitCode = 1;
+        }
+      } catch (error) {
+        logger.error(
+          "Unexpected error",
+          error instanceof Error ? error : undefined,
+        );
+        const message = error instanceof Error ? error.message : String(error);
+        console.error(`Error: ${message}`);
+        process.exitCode = 1;
+      }
+    });
+  }
+
+  return program;
+}
@@ -1,4 +1,4 @@
-import { promises as fs } from "node:fs";
+import { type Dirent, promises as fs } from "node:fs";
 import path from "node:path";
 
 import { STATE_DIR } from "../../../constants.js";
@@ -8,6 +8,7 @@ import type {
   CommandResult,
 } from "../../../shared/interfaces/command.interface.js";
 import { BaseCommand } from "../base.command.js";
+import { COMMAND_DESCRIPTIONS } from "../command.catalog.js";
 
 /**
  * Destroy command handler
@@ -15,12 +16,12 @@ import { BaseCommand } from "../base.command.js";
  */
 export class DestroyCommand extends BaseCommand {
   readonly name = "destroy";
-  readonly description = "Remove envkit state from the current workspace";
+  readonly description = COMMAND_DESCRIPTIONS.destroy;
   private readonly logger = getEnvkitLogger({ component: "destroy-command" });
 
-  private async listStateEntries(stateDirectory: string): Promise<string[]> {
+  private async listStateEntries(stateDirectory: string): Promise<Dirent[]> {
     try {
-      return await fs.readdir(stateDirectory);
+      return await fs.readdir(stateDirectory, { withFileTypes: true });
     } catch {
       return [];
     }
@@ -28,13 +29,24 @@ export class DestroyCommand extends BaseCommand {
 
   private async removeStateEntry(
     stateDirectory: string,
-    entry: string,
+    entry: Dirent,
     shouldPreserveLogs: boolean,
   ): Promise<void> {
-    if (shouldPreserveLogs && entry === "envkit.log") {
+    if (shouldPreserveLogs && entry.name === "envkit.log") {
       return;
     }
-    await fs.rm(path.join(stateDirectory, entry), {
+    const entryPath = path.join(stateDirectory, entry.name);
+    // The dirent already knows the entry type, so plain files skip the
+    // lstat that fs.rm performs before deciding how to remove
+    if (!entry.isDirectory()) {
+      try {
+        await fs.unlink(entryPath);
+        return;
+      } catch {
+        // Fall through to fs.rm, which tolerates races and odd entry types
+      }
+    }
+    await fs.rm(entryPath, {
       recursive: true,
       force: true,
     });
@@ -48,9 +60,11 @@ export class DestroyCommand extends BaseCommand {
 
       const entries = await this.listStateEntries(stateDirectory);
 
-      for (const entry of entries) {
-        await this.removeStateEntry(stateDirectory, entry, shouldPreserveLogs);
-      }
+      await Promise.all(
+        entries.map((entry) =>
+          this.removeStateEntry(stateDirectory, entry, shouldPreserveLogs),
+        ),
+      );
 
       const message = `Destroyed envkit state${shouldPreserveLogs ? " (keeping logs)" : ""}`;
       this.logger.warn(message, { preserveLogs: shouldPreserveLogs });
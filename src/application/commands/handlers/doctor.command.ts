@@ -6,6 +6,7 @@ import type {
   CommandResult,
 } from "../../../shared/interfaces/command.interface.js";
 import { BaseCommand } from "../base.command.js";
+import { COMMAND_DESCRIPTIONS } from "../command.catalog.js";
 
 const DEFAULT_SPEC = "envkit.yaml";
 
@@ -15,7 +16,7 @@ const DEFAULT_SPEC = "envkit.yaml";
  */
 export class DoctorCommand extends BaseCommand {
   readonly name = "doctor";
-  readonly description = "Run environment health checks defined in envkit.yaml";
+  readonly description = COMMAND_DESCRIPTIONS.doctor;
   private readonly logger = getEnvkitLogger({ component: "doctor-command" });
 
   async execute(args: CommandArguments): Promise<CommandResult> {
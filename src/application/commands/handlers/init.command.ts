@@ -8,6 +8,7 @@ import type {
 } from "../../../shared/interfaces/command.interface.js";
 import { ensureStateDirectories } from "../../../state.js";
 import { BaseCommand } from "../base.command.js";
+import { COMMAND_DESCRIPTIONS } from "../command.catalog.js";
 
 const DEFAULT_SPEC = "envkit.yaml";
 const SAMPLE_SPEC_CONTENT = `name: sample-service
@@ -34,8 +35,7 @@ checks:
  */
 export class InitCommand extends BaseCommand {
   readonly name = "init";
-  readonly description =
-    "Create a starter envkit.yaml spec and state directories";
+  readonly description = COMMAND_DESCRIPTIONS.init;
   private readonly logger = getEnvkitLogger({ component: "init-command" });
 
   async execute(args: CommandArguments): Promise<CommandResult> {
@@ -6,6 +6,7 @@ import type {
   CommandResult,
 } from "../../../shared/interfaces/command.interface.js";
 import { BaseCommand } from "../base.command.js";
+import { COMMAND_DESCRIPTIONS } from "../command.catalog.js";
 
 const DEFAULT_SPEC = "envkit.yaml";
 
@@ -15,8 +16,7 @@ const DEFAULT_SPEC = "envkit.yaml";
  */
 export class ProvisionCommand extends BaseCommand {
   readonly name = "provision";
-  readonly description =
-    "Provision toolchains and secrets defined in envkit.yaml";
+  readonly description = COMMAND_DESCRIPTIONS.provision;
   private readonly logger = getEnvkitLogger({ component: "provision-command" });
 
   async execute(args: CommandArguments): Promise<CommandResult> {
@@ -6,6 +6,7 @@ import type {
   CommandResult,
 } from "../../../shared/interfaces/command.interface.js";
 import { BaseCommand } from "../base.command.js";
+import { COMMAND_DESCRIPTIONS } from "../command.catalog.js";
 
 const DEFAULT_SPEC = "envkit.yaml";
 
@@ -15,7 +16,7 @@ const DEFAULT_SPEC = "envkit.yaml";
  */
 export class SecretsCommand extends BaseCommand {
   readonly name = "secrets";
-  readonly description = "Fetch all secrets via the configured broker";
+  readonly description = COMMAND_DESCRIPTIONS.secrets;
   private readonly logger = getEnvkitLogger({ component: "secrets-command" });
 
   async execute(args: CommandArguments): Promise<CommandResult> {
@@ -6,6 +6,7 @@ import type {
 } from "../../../shared/interfaces/command.interface.js";
 import { createSnapshot } from "../../../snapshot.js";
 import { BaseCommand } from "../base.command.js";
+import { COMMAND_DESCRIPTIONS } from "../command.catalog.js";
 
 const DEFAULT_SPEC = "envkit.yaml";
 
@@ -15,7 +16,7 @@ const DEFAULT_SPEC = "envkit.yaml";
  */
 export class SnapshotCommand extends BaseCommand {
   readonly name = "snapshot";
-  readonly description = "Create deterministic lockfile for the current spec";
+  readonly description = COMMAND_DESCRIPTIONS.snapshot;
   private readonly logger = getEnvkitLogger({ component: "snapshot-command" });
 
   async execute(args: CommandArguments): Promise<CommandResult> {
@@ -1,4 +1,4 @@
-import { createHash } from "node:crypto";
+import { createHash, type Hash } from "node:crypto";
 import { promises as fs } from "node:fs";
 import path from "node:path";
 
@@ -6,19 +6,196 @@ import { NotFoundError, ValidationError } from "@kitiumai/error";
 import { isObject } from "@kitiumai/utils-ts";
 import { parse as parseYaml } from "yaml";
 
+import { ValidationPipeline } from "./infrastructure/validation/validation.pipeline.js";
+import { PolicyValidator } from "./infrastructure/validation/validators/policy.validator.js";
+import { SecretsValidator } from "./infrastructure/validation/validators/secrets.validator.js";
+import { ToolchainValidator } from "./infrastructure/validation/validators/toolchain.validator.js";
 import type { EnvironmentSpec } from "./types.js";
 
 const SOURCE = "@kitiumai/envkit";
 
+let specStructurePipeline: ValidationPipeline<EnvironmentSpec> | undefined;
+
+/**
+ * Structural validators for loaded specs, built once per process.
+ * Deliberately separate from the ServiceLocator's "validationPipeline":
+ * it omits SpecNameValidator, whose character rules are stricter than the
+ * name check loadSpec has always applied, and resolving the locator would
+ * also construct its storage provider and transaction manager on every
+ * CLI run.
+ */
+function getSpecStructurePipeline(): ValidationPipeline<EnvironmentSpec> {
+  specStructurePipeline ??= new ValidationPipeline<EnvironmentSpec>()
+    .addValidator(new ToolchainValidator())
+    .addValidator(new SecretsValidator())
+    .addValidator(new PolicyValidator());
+  return specStructurePipeline;
+}
+
 export type LoadSpecOptions = {
   cwd?: string;
 };
 
+/**
+ * Fingerprints of specs returned by loadSpec. Those specs are deep-frozen,
+ * so the digest cannot go stale and is computed once per spec.
+ */
+const fingerprintCache = new WeakMap<EnvironmentSpec, string>();
+
+const CANONICAL_FLUSH_SIZE = 16 * 1024;
+
+/**
+ * Buffers canonical JSON tokens and hands them to the hash in ~16 KiB
+ * chunks: peak memory stays bounded without paying a native update() call
+ * per token
+ */
+class CanonicalHashWriter {
+  private pending = "";
+
+  constructor(private readonly hash: Hash) {}
+
+  write(token: string): void {
+    this.pending += token;
+    if (this.pending.length >= CANONICAL_FLUSH_SIZE) {
+      this.flush();
+    }
+  }
+
+  flush(): void {
+    if (this.pending.length > 0) {
+      this.hash.update(this.pending);
+      this.pending = "";
+    }
+  }
+}
+
+/**
+ * Write the canonical (key-sorted, compact) JSON form of a value, without
+ * building the whole serialized string in memory
+ */
+function feedCanonical(writer: CanonicalHashWriter, value: unknown): void {
+  if (
+    value !== null &&
+    typeof value === "object" &&
+    typeof (value as { toJSON?: unknown }).toJSON === "function"
+  ) {
+    feedCanonical(writer, (value as { toJSON: () => unknown }).toJSON());
+    return;
+  }
+  if (Array.isArray(value)) {
+    writer.write("[");
+    for (const [index, item] of value.entries()) {
+      if (index > 0) {
+        writer.write(",");
+      }
+      feedCanonical(
+        writer,
+        item === undefined || typeof item === "function" ? null : item,
+      );
+    }
+    writer.write("]");
+    return;
+  }
+  if (value !== null && typeof value === "object") {
+    writer.write("{");
+    let isFirst = true;
+    for (const key of Object.keys(value).sort()) {
+      const item = (value as Record<string, unknown>)[key];
+      if (item === undefined || typeof item === "function") {
+        continue;
+      }
+      if (!isFirst) {
+        writer.write(",");
+      }
+      writer.write(JSON.stringify(key));
+      writer.write(":");
+      feedCanonical(writer, item);
+      isFirst = false;
+    }
+    writer.write("}");
+    return;
+  }
+  writer.write(JSON.stringify(value) ?? "null");
+}
+
+function hashField(field: string, value: unknown): Buffer {
+  const hash = createHash("sha256");
+  const writer = new CanonicalHashWriter(hash);
+  writer.write(`${field}:`);
+  feedCanonical(writer, value);
+  writer.flush();
+  return hash.digest();
+}
+
+/**
+ * Incremental spec fingerprint
+ * Each top-level field is hashed on its own and the digests are XOR-combined,
+ * so replacing one field only rehashes that field instead of the whole spec.
+ */
+export class SpecFingerprint {
+  private readonly fieldDigests = new Map<keyof EnvironmentSpec, Buffer>();
+  private readonly combined = Buffer.alloc(32);
+
+  constructor(spec: EnvironmentSpec) {
+    for (const field of Object.keys(spec) as (keyof EnvironmentSpec)[]) {
+      this.set(field, spec[field]);
+    }
+  }
+
+  /**
+   * Replace the value of a top-level field (undefined removes it)
+   */
+  set<K extends keyof EnvironmentSpec>(
+    field: K,
+    value: EnvironmentSpec[K] | undefined,
+  ): void {
+    const previous = this.fieldDigests.get(field);
+    if (previous) {
+      this.xor(previous);
+      this.fieldDigests.delete(field);
+    }
+    if (value === undefined) {
+      return;
+    }
+    const digest = hashField(field, value);
+    this.xor(digest);
+    this.fieldDigests.set(field, digest);
+  }
+
+  digest(): string {
+    return this.combined.toString("hex");
+  }
+
+  private xor(digest: Buffer): void {
+    for (let index = 0; index < this.combined.length; index++) {
+      this.combined[index] = (this.combined[index] ?? 0) ^ (digest[index] ?? 0);
+    }
+  }
+}
+
+function computeFingerprint(spec: EnvironmentSpec): string {
+  return new SpecFingerprint(spec).digest();
+}
+
 export function fingerprintSpec(spec: EnvironmentSpec): string {
-  const stable = JSON.stringify(spec, Object.keys(spec).sort());
-  return createHash("sha256").update(stable).digest("hex");
+  return fingerprintCache.get(spec) ?? computeFingerprint(spec);
 }
 
+function deepFreeze<T>(value: T): T {
+  if (value !== null && typeof value === "object" && !Object.isFrozen(value)) {
+    for (const child of Object.values(value)) {
+      deepFreeze(child);
+    }
+    Object.freeze(value);
+  }
+  return value;
+}
+
+/**
+ * Load, parse and validate an environment spec.
+ * The returned spec is deep-frozen (its fingerprint is memoized), so
+ * mutating it throws a TypeError; copy it to derive a modified spec.
+ */
 export async function loadSpec(
   specPath: string,
   options: LoadSpecOptions = {},
@@ -32,7 +209,9 @@ export async function loadSpec(
     const raw = await fs.readFile(fullPath, "utf-8");
     const parsed = parseContent(raw, specPath);
     validateSpec(parsed);
-    return parsed;
+    const spec = deepFreeze(parsed);
+    fingerprintCache.set(spec, computeFingerprint(spec));
+    return spec;
   } catch (error) {
     if (error instanceof Error && "code" in error && error.code === "ENOENT") {
       throw new NotFoundError({
@@ -48,13 +227,87 @@ export async function loadSpec(
   }
 }
 
+/**
+ * Count object members in a JSON document: every colon outside a string
+ * separates exactly one key from its value
+ */
+function countJsonMembers(raw: string): number {
+  let count = 0;
+  let isInString = false;
+  for (let index = 0; index < raw.length; index++) {
+    const char = raw[index];
+    if (isInString) {
+      if (char === "\\") {
+        index++;
+      } else if (char === '"') {
+        isInString = false;
+      }
+    } else if (char === '"') {
+      isInString = true;
+    } else if (char === ":") {
+      count++;
+    }
+  }
+  return count;
+}
+
+function countParsedMembers(value: unknown): number {
+  if (value === null || typeof value !== "object") {
+    return 0;
+  }
+  const children = Array.isArray(value) ? value : Object.values(value);
+  let count = Array.isArray(value) ? 0 : children.length;
+  for (const child of children) {
+    count += countParsedMembers(child);
+  }
+  return count;
+}
+
+/**
+ * Parse a JSON document with the native parser, or return undefined when it
+ * is not JSON or repeats a key (JSON.parse keeps the last value, while the
+ * YAML parser rejects duplicate keys)
+ */
+function parseJsonDocument(raw: string): EnvironmentSpec | undefined {
+  let parsed: unknown;
+  try {
+    parsed = JSON.parse(raw);
+  } catch {
+    // Flow-style YAML mapping rather than JSON
+    return undefined;
+  }
+  if (countParsedMembers(parsed) !== countJsonMembers(raw)) {
+    return undefined;
+  }
+  return parsed as EnvironmentSpec;
+}
+
+/**
+ * Parse YAML without line tracking; pretty errors (line/column positions)
+ * are only produced by re-parsing when the fast path fails. Specs that are
+ * JSON documents (valid YAML too) go through the native JSON parser first.
+ */
+function parseYamlSpec(raw: string): EnvironmentSpec {
+  if (raw.trimStart().startsWith("{")) {
+    const parsed = parseJsonDocument(raw);
+    if (parsed !== undefined) {
+      return parsed;
+    }
+  }
+  try {
+    return parseYaml(raw, { prettyErrors: false }) as EnvironmentSpec;
+  } catch {
+    return parseYaml(raw) as EnvironmentSpec;
+  }
+}
+
 function parseContent(raw: string, specPath: string): EnvironmentSpec {
   const extension = path.extname(specPath).toLowerCase();
   try {
     if (extension === ".json") {
       return JSON.parse(raw) as EnvironmentSpec;
     }
-    return parseYaml(raw) as EnvironmentSpec;
+    return parseYamlSpec(raw);
   } catch (error) {
     throw new ValidationError({
       code: "envkit/spec_parse_error",
@@ -86,4 +339,18 @@ function validateSpec(spec: EnvironmentSpec): void {
       source: SOURCE,
     });
   }
+
+  const result = getSpecStructurePipeline().validate(spec);
+  if (!result.isValid) {
+    const details = result.errors
+      .map((errorDetail) => errorDetail.message)
+      .join("; ");
+    throw new ValidationError({
+      code: "envkit/spec_invalid",
+      message: `Environment spec is invalid: ${details}`,
+      severity: "error",
+      retryable: false,
+      source: SOURCE,
+    });
+  }
 }
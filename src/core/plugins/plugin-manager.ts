@@ -82,17 +82,22 @@ export class PluginManager {
   ): Promise<void> {
     const errors: Array<{ plugin: string; error: Error }> = [];
 
-    for (const plugin of this.plugins.values()) {
+    // Snapshot the plugins implementing this hook before running any of them
+    const targets = Array.from(this.plugins.values()).flatMap((plugin) => {
       const hook = plugin.hooks?.[hookName];
-      if (!hook) {
-        continue;
-      }
+      return hook ? [{ plugin, hook }] : [];
+    });
+    if (targets.length === 0) {
+      return;
+    }
 
+    this.logger.debug("Executing plugin hook", {
+      hook: hookName,
+      plugins: targets.map(({ plugin }) => plugin.name),
+    });
+
+    for (const { plugin, hook } of targets) {
       try {
-        this.logger.debug("Executing plugin hook", {
-          plugin: plugin.name,
-          hook: hookName,
-        });
         await (
           hook as (
             ...hookArguments: Parameters<NonNullable<PluginHooks[K]>>
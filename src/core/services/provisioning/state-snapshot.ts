@@ -39,13 +39,14 @@ export class StateSnapshotManager {
       }
     }
 
+    const timestamp = new Date();
     this.logger.info("State snapshot created", {
       files: files.size,
-      timestamp: new Date(),
+      timestamp,
     });
 
     return {
-      timestamp: new Date(),
+      timestamp,
       files,
     };
   }
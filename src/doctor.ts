@@ -1,11 +1,14 @@
-import { exec } from "node:child_process";
+import { exec, execFile } from "node:child_process";
+import { constants as fsConstants, promises as fs } from "node:fs";
 import path from "node:path";
+import { performance } from "node:perf_hooks";
 import { promisify } from "node:util";
 
 import { timeout } from "@kitiumai/utils-ts";
 
 import { DOCTOR_REPORT_FILE } from "./constants.js";
 import { getEnvkitLogger } from "./logger.js";
+import { tokenizeCommand } from "./shared/helpers/command-tokenizer.js";
 import { ensureStateDirectories, writeJson } from "./state.js";
 import type {
   DoctorCheckResult,
@@ -14,19 +17,104 @@ import type {
 } from "./types.js";
 
 const execAsync = promisify(exec);
+const execFileAsync = promisify(execFile);
+const MAX_CONCURRENT_CHECKS = 8;
+const resolvedExecutables = new Map<string, Promise<string | undefined>>();
 
 export type DoctorOptions = {
   cwd?: string;
 };
 
+async function findOnPath(
+  file: string,
+  searchPath: string,
+): Promise<string | undefined> {
+  for (const directory of searchPath.split(path.delimiter)) {
+    // Relative entries depend on the check's cwd; leave those to the shell
+    if (!path.isAbsolute(directory)) {
+      continue;
+    }
+    const candidate = path.join(directory, file);
+    try {
+      // X_OK alone also accepts directories
+      if ((await fs.stat(candidate)).isFile()) {
+        await fs.access(candidate, fsConstants.X_OK);
+        return candidate;
+      }
+    } catch {
+      // Not in this directory
+    }
+  }
+  return undefined;
+}
+
+/**
+ * Resolve a bare command name against PATH, memoized per PATH value so a
+ * caller that changes PATH (e.g. after provisioning a toolchain) gets the
+ * new binary. Resolves to undefined when no executable is found (e.g.
+ * shell builtins).
+ */
+function resolveExecutable(file: string): Promise<string | undefined> {
+  if (file.includes(path.sep)) {
+    return Promise.resolve(file);
+  }
+  const searchPath = process.env["PATH"] ?? "";
+  const cacheKey = `${searchPath}\0${file}`;
+  let resolved = resolvedExecutables.get(cacheKey);
+  if (!resolved) {
+    resolved = findOnPath(file, searchPath);
+    resolvedExecutables.set(cacheKey, resolved);
+  }
+  return resolved;
+}
+
+/**
+ * Run a check directly when possible, skipping the intermediate shell.
+ * The tokenizer follows POSIX sh quoting, so on Windows checks always go
+ * through cmd.exe, which treats quotes and %VAR% differently.
+ */
+async function runCheckCommand(
+  command: string,
+  cwd: string,
+): Promise<{ stdout: string; stderr: string }> {
+  const argv =
+    process.platform === "win32" ? undefined : tokenizeCommand(command);
+  if (!argv) {
+    return execAsync(command, { cwd });
+  }
+
+  const [file = "", ...args] = argv;
+  const executable = await resolveExecutable(file);
+  if (!executable) {
+    return execAsync(command, { cwd });
+  }
+  try {
+    return await execFileAsync(executable, args, { cwd });
+  } catch (error) {
+    // Executable removed since it was resolved
+    if ((error as NodeJS.ErrnoException).code === "ENOENT") {
+      return execAsync(command, { cwd });
+    }
+    throw error;
+  }
+}
+
+/**
+ * Milliseconds since startedAt, to one decimal so sub-millisecond checks
+ * still show as non-zero
+ */
+function elapsedMs(startedAt: number): number {
+  return Math.round((performance.now() - startedAt) * 10) / 10;
+}
+
 async function executeDoctorCheck(
   command: string,
   cwd: string,
 ): Promise<DoctorCheckResult> {
-  const startedAt = Date.now();
+  const startedAt = performance.now();
   try {
     const { stdout, stderr } = await timeout(
-      execAsync(command, { cwd }),
+      runCheckCommand(command, cwd),
       15000,
       `Command execution timed out: ${command}`,
     );
@@ -35,7 +123,7 @@ async function executeDoctorCheck(
       success: true,
       stdout: stdout.trim(),
       stderr: stderr.trim(),
-      durationMs: Date.now() - startedAt,
+      durationMs: elapsedMs(startedAt),
     };
   } catch (error) {
     const execError = error as {
@@ -48,11 +136,32 @@ async function executeDoctorCheck(
       success: false,
       stdout: (execError.stdout ?? "").toString().trim(),
       stderr: (execError.stderr ?? execError.message ?? "").toString().trim(),
-      durationMs: Date.now() - startedAt,
+      durationMs: elapsedMs(startedAt),
     };
   }
 }
 
+/**
+ * Run checks on a bounded pool of workers; results keep the check order
+ */
+async function executeDoctorChecks(
+  commands: string[],
+  cwd: string,
+): Promise<DoctorCheckResult[]> {
+  const results: DoctorCheckResult[] = Array.from({ length: commands.length });
+  let nextIndex = 0;
+  const worker = async (): Promise<void> => {
+    while (nextIndex < commands.length) {
+      const index = nextIndex++;
+      results[index] = await executeDoctorCheck(commands[index] ?? "", cwd);
+    }
+  };
+
+  const workerCount = Math.min(MAX_CONCURRENT_CHECKS, commands.length);
+  await Promise.all(Array.from({ length: workerCount }, worker));
+  return results;
+}
+
 export async function runDoctor(
   spec: EnvironmentSpec,
   options: DoctorOptions = {},
@@ -64,12 +173,7 @@ export async function runDoctor(
   });
   await ensureStateDirectories(cwd);
 
-  const results: DoctorCheckResult[] = [];
-  if (spec.checks && spec.checks.length > 0) {
-    for (const command of spec.checks) {
-      results.push(await executeDoctorCheck(command, cwd));
-    }
-  }
+  const results = await executeDoctorChecks(spec.checks ?? [], cwd);
 
   const passed = results.filter((result) => result.success).length;
   const report: DoctorReport = {
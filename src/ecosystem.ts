@@ -391,9 +391,10 @@ export class IntegrationRegistry {
       this.instances.set(id, instance);
 
       // Update integration status
+      const now = new Date();
       integration.status = "active";
-      integration.lastUsedAt = new Date();
-      integration.updatedAt = new Date();
+      integration.lastUsedAt = now;
+      integration.updatedAt = now;
 
       return { success: true, data: instance };
     } catch (error) {
@@ -435,8 +436,9 @@ export class IntegrationRegistry {
       const result = await provider.execute(context);
 
       // Update last used timestamp
-      integration.lastUsedAt = new Date();
-      integration.updatedAt = new Date();
+      const now = new Date();
+      integration.lastUsedAt = now;
+      integration.updatedAt = now;
 
       return result;
     } catch (error) {
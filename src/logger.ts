@@ -24,23 +24,24 @@ export function getEnvkitLogger(
   const prefix = "[envkit]";
 
   // Use child logger with context if available (IAdvancedLogger interface)
-  const contextualLogger =
-    "child" in logger && typeof logger.child === "function"
-      ? (logger as IAdvancedLogger).child({ component: "envkit", ...context })
-      : logger;
+  const hasChild = "child" in logger && typeof logger.child === "function";
+  const contextualLogger = hasChild
+    ? (logger as IAdvancedLogger).child({ component: "envkit", ...context })
+    : logger;
+
+  // A child logger already carries the context, so events only need their
+  // own metadata; the plain logger gets the context merged per event.
+  const withContext = (
+    metadata?: Record<string, unknown>,
+  ): Record<string, unknown> | undefined =>
+    hasChild ? metadata : { ...context, ...metadata };
 
   return {
     info: (message: string, metadata?: Record<string, unknown>): void => {
-      contextualLogger.info(`${prefix} ${message}`, {
-        ...context,
-        ...metadata,
-      });
+      contextualLogger.info(`${prefix} ${message}`, withContext(metadata));
     },
     warn: (message: string, metadata?: Record<string, unknown>): void => {
-      contextualLogger.warn(`${prefix} ${message}`, {
-        ...context,
-        ...metadata,
-      });
+      contextualLogger.warn(`${prefix} ${message}`, withContext(metadata));
     },
     error: (
       message: string,
@@ -50,21 +51,15 @@ export function getEnvkitLogger(
       if (error) {
         contextualLogger.error(
           `${prefix} ${message}`,
-          { ...context, ...metadata },
+          withContext(metadata),
           error,
         );
       } else {
-        contextualLogger.error(`${prefix} ${message}`, {
-          ...context,
-          ...metadata,
-        });
+        contextualLogger.error(`${prefix} ${message}`, withContext(metadata));
       }
     },
     debug: (message: string, metadata?: Record<string, unknown>): void => {
-      contextualLogger.debug(`${prefix} ${message}`, {
-        ...context,
-        ...metadata,
-      });
+      contextualLogger.debug(`${prefix} ${message}`, withContext(metadata));
     },
   };
 }
@@ -9,7 +9,8 @@ export class PluginRegistry {
   }
 
   async run(event: string, context: Record<string, unknown>): Promise<void> {
-    const hooks = this.hooks[event] ?? [];
+    // Snapshot so hooks registered while running wait for the next run
+    const hooks = this.hooks[event]?.slice() ?? [];
     for (const hook of hooks) {
       await hook(context);
     }
@@ -29,5 +29,9 @@ export async function provisionEnvironment(
   };
   const lastAppliedPath = path.join(cwd, LAST_APPLIED_FILE);
   await writeJson(lastAppliedPath, state);
-  logger.info("Environment provisioned", state);
+  logger.info("Environment provisioned", {
+    toolchains: state.toolchains.length,
+    secrets: state.secrets.length,
+    policies: state.policies.length,
+  });
 }
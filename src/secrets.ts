@@ -129,45 +129,63 @@ export class SecretsBroker {
 
   async fetchAll(): Promise<Record<string, string>> {
     const results: Record<string, string> = {};
+    const fetched: string[] = [];
+    const unconfigured: string[] = [];
 
-    for (const provider of this.providers) {
-      try {
-        const secretsProvider = this.secretsProviders.get(provider.provider);
-        if (secretsProvider) {
-          const secretValue = await secretsProvider.fetchSecret(provider.path);
-          results[`${provider.provider}:${provider.path}`] = secretValue;
-          this.logger.info("Secret fetched successfully", {
-            provider: provider.provider,
-            path: provider.path,
-          });
-        } else {
-          this.logger.warn("Secrets provider not configured", {
-            provider: provider.provider,
-            path: provider.path,
-          });
-          // Fallback to placeholder for backward compatibility
-          results[`${provider.provider}:${provider.path}`] =
-            `placeholder-secret-for-${provider.provider}:${provider.path}`;
+    try {
+      for (const provider of this.providers) {
+        const key = `${provider.provider}:${provider.path}`;
+        try {
+          const secretsProvider = this.secretsProviders.get(provider.provider);
+          if (secretsProvider) {
+            results[key] = await secretsProvider.fetchSecret(provider.path);
+            fetched.push(key);
+          } else {
+            // Fallback to placeholder for backward compatibility
+            results[key] = `placeholder-secret-for-${key}`;
+            unconfigured.push(key);
+          }
+        } catch (error) {
+          const errorMessage =
+            error instanceof Error ? error.message : String(error);
+          this.logger.error(
+            "Failed to fetch secret",
+            error instanceof Error ? error : undefined,
+            {
+              provider: provider.provider,
+              path: provider.path,
+              error: errorMessage,
+            },
+          );
+          throw error;
         }
-      } catch (error) {
-        const errorMessage =
-          error instanceof Error ? error.message : String(error);
-        this.logger.error(
-          "Failed to fetch secret",
-          error instanceof Error ? error : undefined,
-          {
-            provider: provider.provider,
-            path: provider.path,
-            error: errorMessage,
-          },
-        );
-        throw error;
       }
+    } finally {
+      // Also runs when a later fetch fails, so earlier outcomes are logged
+      this.logFetchOutcome(fetched, unconfigured);
     }
 
     return results;
   }
 
+  /**
+   * Emit one event per outcome rather than one per secret
+   */
+  private logFetchOutcome(fetched: string[], unconfigured: string[]): void {
+    if (fetched.length > 0) {
+      this.logger.info("Secrets fetched successfully", {
+        count: fetched.length,
+        secrets: fetched,
+      });
+    }
+    if (unconfigured.length > 0) {
+      this.logger.warn("Secrets provider not configured", {
+        count: unconfigured.length,
+        secrets: unconfigured,
+      });
+    }
+  }
+
   async rotateSecrets(): Promise<void> {
     for (const provider of this.providers) {
       if (provider.rotationDays && provider.rotationDays > 0) {
@@ -0,0 +1,49 @@
+const SHELL_METACHARACTERS = new Set([..."|&;<>()$`\\*?[]{}~#!\n"]);
+
+/**
+ * Split a command into argv when it is a plain command line (words and
+ * quoted strings only). Returns undefined when shell features are used.
+ */
+export function tokenizeCommand(command: string): string[] | undefined {
+  const tokens: string[] = [];
+  let current = "";
+  let hasToken = false;
+  let quote: string | undefined;
+
+  for (const character of command) {
+    if (quote) {
+      if (character === quote) {
+        quote = undefined;
+      } else if (quote === '"' && "$`\\".includes(character)) {
+        return undefined;
+      } else {
+        current += character;
+      }
+      continue;
+    }
+    if (character === '"' || character === "'") {
+      quote = character;
+      hasToken = true;
+    } else if (character === " " || character === "\t") {
+      if (hasToken) {
+        tokens.push(current);
+        current = "";
+        hasToken = false;
+      }
+    } else if (SHELL_METACHARACTERS.has(character)) {
+      return undefined;
+    } else {
+      current += character;
+      hasToken = true;
+    }
+  }
+
+  if (hasToken) {
+    tokens.push(current);
+  }
+  const [file] = tokens;
+  if (quote || !file || file.includes("=")) {
+    return undefined;
+  }
+  return tokens;
+}